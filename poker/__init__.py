@@ -0,0 +1,20 @@
+import importlib
+
+# Public names resolved on first access, so `import poker` stays cheap and
+# worker processes only load the modules they actually use.
+_lazy_exports = {
+    'Game': '.game',
+    'State': '.state',
+    'Positions': '.positions',
+    'SessionLogWriter': '.session_log',
+    'replay_sessions': '.replay',
+    'reprice': '.replay',
+}
+
+__all__ = list(_lazy_exports)
+
+
+def __getattr__(name: str):
+    if name not in _lazy_exports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_lazy_exports[name], __name__), name)
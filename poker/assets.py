@@ -1,23 +1,36 @@
-import numpy as np
+from __future__ import annotations
+
 from copy import deepcopy
 import random
 from math import factorial
 from typing import Tuple
 
-from state import State
-from deck_utils import *
-from pmf_utils import *
+from .lazy_module import LazyModule
+from .deck import Card
+from .state import State
+from .deck_utils import (filter_suit, filter_value_by_range, get_suit_count, get_suit_value_sum,
+                         get_value_max, get_value_min, get_value_sum, to_values)
+from .pmf_utils import (get_binomial_pmf, get_expected_value_from_pmf, get_k_round_max_probs,
+                        get_k_round_min_probs, get_sample_pmf, get_suit_count_analytic_pmf)
+
+np = LazyModule('numpy')
 
 
 class AssetBase:
 
-    def __init__(self, state: State):
+    # priced=False skips the eager pricing below, for callers such as replay
+    # that only need the asset definition and price it with their own engine.
+    def __init__(self, state: State, priced: bool = True):
         self.state = deepcopy(state)
         self.sample_size = 50000
+        if priced:
+            self.price()
+
+    def price(self):
         #self.sample_pmf = self.get_sample_pmf()
         self.analytic_pmf = self.get_analytic_pmf()
         #self.expected_value_sample = self.get_expected_value_sample()
-        self.expected_value_analytic = self.get_expected_value_analytic()
+        self.expected_value_analytic = get_expected_value_from_pmf(*self.analytic_pmf)
         #delta = self.expected_value_analytic - self.expected_value_sample
         #assert abs(delta) / abs(self.expected_value_sample) < 0.01
 
@@ -61,13 +74,13 @@ class AssetBase:
         raise NotImplementedError("to_string() not implemented")
 
     def guarantee_trade_market_width(self) -> float:
-        return random.uniform(0.1, 0.5) * self.get_expected_value_analytic()
+        return random.uniform(0.1, 0.5) * self.expected_value_analytic
 
 
 class SumOfValuesAsset(AssetBase):
 
-    def __init__(self, state: State):
-        super().__init__(state)
+    def __init__(self, state: State, priced: bool = True):
+        super().__init__(state, priced)
 
     def get_cards_value(self, cards: list[Card]) -> float:
         return get_value_sum(cards)
@@ -90,9 +103,9 @@ class SumOfValuesAsset(AssetBase):
 
 class SumOfSuitValuesAsset(AssetBase):
 
-    def __init__(self, state: State, suit: str):
+    def __init__(self, state: State, suit: str, priced: bool = True):
         self.suit = suit
-        super().__init__(state)
+        super().__init__(state, priced)
 
     def get_cards_value(self, cards: list[Card]) -> float:
         return get_value_sum(filter_suit(cards, self.suit))
@@ -114,10 +127,10 @@ class SumOfSuitValuesAsset(AssetBase):
 
 class XDivideBySuitCountAsset(AssetBase):
 
-    def __init__(self, state: State, numerator: float, suit: str):
+    def __init__(self, state: State, numerator: float, suit: str, priced: bool = True):
         self.numerator = numerator
         self.suit = suit
-        super().__init__(state)
+        super().__init__(state, priced)
 
     def get_cards_value(self, cards: list[Card]) -> float:
         return self.numerator / len(filter_suit(cards, self.suit))
@@ -125,7 +138,7 @@ class XDivideBySuitCountAsset(AssetBase):
     def get_analytic_pmf(self) -> Tuple[np.ndarray, np.ndarray]:
         assert (get_suit_count(self.state.cards, self.suit) >= 1)
         xs, ys = get_suit_count_analytic_pmf(self.state, self.suit)
-        xs = self.numerator / np.array(xs)
+        xs = [self.numerator / x for x in xs]
         return xs, ys
 
     def to_string(self):
@@ -134,17 +147,17 @@ class XDivideBySuitCountAsset(AssetBase):
 
 class XToTheSuitCountAsset(AssetBase):
 
-    def __init__(self, state: State, base: float, suit: str):
+    def __init__(self, state: State, base: float, suit: str, priced: bool = True):
         self.base = base
         self.suit = suit
-        super().__init__(state)
+        super().__init__(state, priced)
 
     def get_cards_value(self, cards: list[Card]) -> float:
         return self.base ** get_suit_count(cards, self.suit)
 
     def get_analytic_pmf(self) -> Tuple[np.ndarray, np.ndarray]:
         xs, ys = get_suit_count_analytic_pmf(self.state, self.suit)
-        xs = self.base ** np.array(xs)
+        xs = [self.base ** x for x in xs]
         return xs, ys
 
     def to_string(self) -> str:
@@ -152,9 +165,9 @@ class XToTheSuitCountAsset(AssetBase):
 
 
 class SuitCountFactorialAsset(AssetBase):
-    def __init__(self, state: State, suit: str):
+    def __init__(self, state: State, suit: str, priced: bool = True):
         self.suit = suit
-        super().__init__(state)
+        super().__init__(state, priced)
 
     def get_cards_value(self, cards: list[Card]) -> float:
         suit_count = get_suit_count(cards, self.suit)
@@ -162,7 +175,7 @@ class SuitCountFactorialAsset(AssetBase):
 
     def get_analytic_pmf(self) -> Tuple[np.ndarray, np.ndarray]:
         xs, ys = get_suit_count_analytic_pmf(self.state, self.suit)
-        xs = np.array([factorial(x) for x in xs])
+        xs = [factorial(x) for x in xs]
         return xs, ys
 
     def to_string(self):
@@ -171,9 +184,9 @@ class SuitCountFactorialAsset(AssetBase):
 
 class MaxSuitValueAsset(AssetBase):
 
-    def __init__(self, state: State, suit: str):
+    def __init__(self, state: State, suit: str, priced: bool = True):
         self.suit = suit
-        super().__init__(state)
+        super().__init__(state, priced)
 
     def get_cards_value(self, cards: list[Card]) -> float:
         return get_value_max(filter_suit(cards, self.suit))
@@ -209,9 +222,9 @@ class MaxSuitValueAsset(AssetBase):
 
 class MinSuitValueAsset(AssetBase):
 
-    def __init__(self, state: State, suit: str):
+    def __init__(self, state: State, suit: str, priced: bool = True):
         self.suit = suit
-        super().__init__(state)
+        super().__init__(state, priced)
 
     def get_cards_value(self, cards: list[Card]) -> float:
         return get_value_min(filter_suit(cards, self.suit))
@@ -252,10 +265,10 @@ class MinSuitValueAsset(AssetBase):
 
 class SuitSideBetAsset(AssetBase):
 
-    def __init__(self, state: State, side: str):
+    def __init__(self, state: State, side: str, priced: bool = True):
         assert (side == 'red' or side == 'black')
         self.side = side
-        super().__init__(state)
+        super().__init__(state, priced)
 
     def get_cards_value(self, cards: list[Card]) -> float:
         next_card = cards[self.state.round]
@@ -274,7 +287,7 @@ class SuitSideBetAsset(AssetBase):
 
         ys = [b_prob, r_prob] if self.side == 'red' else [r_prob, b_prob]
 
-        return np.array(xs), np.array(ys)
+        return xs, ys
 
     def to_string(self):
         return f"suit side bet: {self.side}"
@@ -282,10 +295,10 @@ class SuitSideBetAsset(AssetBase):
 
 class ValueSideBetAsset(AssetBase):
 
-    def __init__(self, state: State, side: str):
+    def __init__(self, state: State, side: str, priced: bool = True):
         assert (side == 'small' or side == 'large')
         self.side = side
-        super().__init__(state)
+        super().__init__(state, priced)
 
     def get_cards_value(self, cards: list[Card]) -> float:
         next_card = cards[self.state.round]
@@ -304,7 +317,7 @@ class ValueSideBetAsset(AssetBase):
 
         ys = [large_prob, small_prob] if self.side == 'small' else [small_prob, large_prob]
 
-        return np.array(xs), np.array(ys)
+        return xs, ys
 
     def to_string(self):
         return f"value side bet: {self.side}"
@@ -0,0 +1,34 @@
+import statistics
+import subprocess
+import sys
+import time
+
+
+# Every case runs in a fresh interpreter and is timed as subprocess wall-clock,
+# so rows are comparable; the bare interpreter row is the startup baseline that
+# the other rows are reported on top of.
+STATEMENTS = {
+    "import poker": "import poker",
+    "import poker.game": "import poker.game",
+    "start a game": "from poker.game import Game; Game()",
+    "price the first asset": ("from poker.game import Game; from poker.assets import SumOfValuesAsset; "
+                              "game = Game(); SumOfValuesAsset(game.state)"),
+}
+
+
+def time_cold_start(stmt: str, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.check_call([sys.executable, "-W", "ignore", "-c", stmt])
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+if __name__ == '__main__':
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    baseline = time_cold_start("pass", repeat)
+    print(f"bare interpreter: {baseline * 1000:.1f} ms")
+    for name, stmt in STATEMENTS.items():
+        total = time_cold_start(stmt, repeat)
+        print(f"{name}: {total * 1000:.1f} ms total, {(total - baseline) * 1000:.1f} ms over bare interpreter")
@@ -1,7 +1,7 @@
 from functools import partial
 from typing import Callable
 
-from deck import Card, Deck
+from .deck import Card, Deck
 
 
 def _func_get_value(card: Card) -> int:
@@ -1,24 +1,34 @@
 import random
+import sys
+from contextlib import nullcontext
+from typing import Optional
 
-from state import State
-from assets import *
-from positions import Positions
-from trader import MaxExpectedReturnTrader
+from .state import State
+from .assets import (AssetBase, SumOfValuesAsset, SumOfSuitValuesAsset, XDivideBySuitCountAsset,
+                     XToTheSuitCountAsset, SuitCountFactorialAsset, MinSuitValueAsset,
+                     SuitSideBetAsset, ValueSideBetAsset)
+from .positions import Positions
+from .trader import MaxExpectedReturnTrader
+from .session_log import SessionLogWriter
 
 
 class Game:
-    def __init__(self):
+    def __init__(self, log_path: Optional[str] = None):
         self.state = State()
         self.positions = Positions()
         self.trader = MaxExpectedReturnTrader()
+        self.log = SessionLogWriter(log_path) if log_path is not None else None
 
     def play(self):
-        self.play_round(0)
-        for i in range(4):
-            self.step()
+        with self.log if self.log is not None else nullcontext():
+            self.play_round(0)
+            for i in range(4):
+                self.step()
 
     def step(self):
         card = self.state.step()
+        if self.log is not None:
+            self.log.log_card(self.state, card)
         print(f"----------Round {self.state.round}----------")
         print(f"Card revealed: {card.to_string()}")
         self.play_round(self.state.round)
@@ -49,26 +59,37 @@ class Game:
         quote = self.read_quotes()
         print(f"Expected value of asset is: {asset.get_expected_value_analytic()}")
         trader_action = self.trader.propose_trade(asset, quote)
+        if self.log is not None:
+            self.log.log_quote(quote)
+            self.log.log_action(trader_action)
+        bid, ask = quote
         if trader_action == 'buy':
             print("I will buy")
-            self.positions.add_position(asset, -1)
+            self.add_position(asset, -1, ask)
         else:
             print("I will sell")
-            self.positions.add_position(asset, 1)
+            self.add_position(asset, 1, bid)
 
     def make_side_bets(self):
         print("Please make suit and value based side bets")
         print("Input two values, first value positive for betting red, second value positive for betting small")
         quote = self.read_quotes()
+        if self.log is not None:
+            self.log.log_side_bets(quote)
         suit_bet_amount, value_bet_amount = quote
         if suit_bet_amount != 0:
-            self.positions.add_position(SuitSideBetAsset(self.state, 'red' if suit_bet_amount > 0 else 'black'),
-                                        abs(suit_bet_amount))
+            self.add_position(SuitSideBetAsset(self.state, 'red' if suit_bet_amount > 0 else 'black'),
+                              abs(suit_bet_amount), 0.0)
         if value_bet_amount != 0:
-            self.positions.add_position(ValueSideBetAsset(self.state, 'small' if value_bet_amount > 0 else 'large'),
-                                        abs(value_bet_amount))
+            self.add_position(ValueSideBetAsset(self.state, 'small' if value_bet_amount > 0 else 'large'),
+                              abs(value_bet_amount), 0.0)
         raise NotImplementedError("Please implement GT side bet amount")
 
+    def add_position(self, asset: AssetBase, amount: float, price: float):
+        self.positions.add_position(asset, amount)
+        if self.log is not None:
+            self.log.log_position(asset, amount, price)
+
     def read_quotes(self) -> list[float]:
         quotes_str = input()
         quotes = quotes_str.split()
@@ -77,5 +98,5 @@ class Game:
 
 
 if __name__ == '__main__':
-    game = Game()
+    game = Game(sys.argv[1] if len(sys.argv) > 1 else None)
     game.play()
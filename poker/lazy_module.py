@@ -0,0 +1,23 @@
+import importlib
+from types import ModuleType
+
+
+# Stand-in for a heavy module that is only imported on first attribute access,
+# so importing the package does not pay for numpy/scipy until they are used.
+class LazyModule:
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def _load(self) -> ModuleType:
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    # Only called for attributes not found on the proxy, so caching each one
+    # makes later accesses (e.g. np.random in the sampling loop) plain lookups.
+    def __getattr__(self, attr: str):
+        value = getattr(self._load(), attr)
+        setattr(self, attr, value)
+        return value
@@ -1,10 +1,15 @@
-import numpy as np
+from __future__ import annotations
+
+from math import comb
 from typing import Tuple, Callable, TYPE_CHECKING
-from scipy.stats import hypergeom, binom
 
-from state import State
+from .lazy_module import LazyModule
+from .deck_utils import get_suit_count
+
+if TYPE_CHECKING:
+    from .state import State
 
-from deck_utils import *
+np = LazyModule('numpy')
 
 
 def get_sample_pmf(sample_value_func: Callable[[], float], sample_size=100000) -> Tuple[np.ndarray, np.ndarray]:
@@ -31,29 +36,52 @@ def get_expected_value_from_pmf(xs: np.ndarray, ys: np.ndarray) -> float:
     return expectation
 
 
-def get_binomial_pmf(n: int, p: float, offset: float) -> Tuple[np.ndarray, np.ndarray]:
-    rv = binom(n, p)
-    xs_togo = np.arange(0, n + 1)
-    probs = rv.pmf(xs_togo)
-    xs = xs_togo + offset
+# Exact pmf with math.comb: n is at most the value sum of the deck (220), so plain
+# lists are enough and pricing the opening round does not load numpy or scipy.
+def get_binomial_pmf(n: int, p: float, offset: float) -> Tuple[list[float], list[float]]:
+    n = int(n)
+    xs = [x_togo + offset for x_togo in range(0, n + 1)]
+    probs = [comb(n, x_togo) * p ** x_togo * (1 - p) ** (n - x_togo) for x_togo in range(0, n + 1)]
 
     return xs, probs
 
 
-def get_suit_count_analytic_pmf(state: State, suit: str) -> Tuple[np.ndarray, np.ndarray]:
+def get_hypergeom_pmf(total: int, target: int, draws: int) -> list[float]:
+    denominator = comb(total, draws)
+    return [comb(target, k) * comb(total - target, draws - k) / denominator
+            for k in range(0, min(draws, target) + 1)]
+
+
+def build_hypergeom_table(deck_size=40, suit_size=10, max_round=4) -> dict[Tuple[int, int, int], list[float]]:
+    table = {}
+    for played_rounds in range(max_round + 1):
+        total = deck_size - played_rounds
+        draws = max_round - played_rounds
+        for target in range(0, suit_size + 1):
+            table[(total, target, draws)] = get_hypergeom_pmf(total, target, draws)
+    return table
+
+
+# Every suit count pmf reachable in a game, computed exactly with math.comb so
+# suit count assets are priced by lookup and never have to load scipy.
+hypergeom_table = build_hypergeom_table()
+
+
+def get_suit_count_analytic_pmf(state: State, suit: str) -> Tuple[list[int], list[float]]:
     base_suit_count = get_suit_count(state.cards, suit)
 
     deck_suits_count = state.deck.suits_count
     deck_total_cards = sum(deck_suits_count.values())
     target_suit_count = deck_suits_count[suit]
     rounds = state.get_remain_rounds()
-    extra_suit_count_distribution = hypergeom(deck_total_cards, target_suit_count, rounds)
 
-    extra_suit_count_xs = np.arange(0, min(rounds, target_suit_count) + 1)
-    probs = extra_suit_count_distribution.pmf(extra_suit_count_xs)
-    suit_count_xs = extra_suit_count_xs + base_suit_count
+    key = (deck_total_cards, target_suit_count, rounds)
+    probs = hypergeom_table.get(key)
+    if probs is None:
+        probs = hypergeom_table[key] = get_hypergeom_pmf(*key)
+    suit_count_xs = [extra_suit_count + base_suit_count for extra_suit_count in range(len(probs))]
 
-    return suit_count_xs.tolist(), probs.tolist()
+    return suit_count_xs, probs
 
 
 def get_k_round_max_probs(probs: np.ndarray, k: int) -> np.ndarray:
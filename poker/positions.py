@@ -1,8 +1,12 @@
-from typing import Tuple
-import numpy as np
+from __future__ import annotations
 
-from assets import AssetBase
-from pmf_utils import get_sample_pmf
+from typing import Tuple, TYPE_CHECKING
+
+from .assets import AssetBase
+from .pmf_utils import get_sample_pmf
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class Positions:
@@ -0,0 +1,143 @@
+import argparse
+from typing import Callable, Iterable, Iterator, Optional, Tuple
+
+from .lazy_module import LazyModule
+from .state import State
+from .assets import AssetBase
+from .session_log import (ACTIONS, ACTION_TAG, CARD_TAG, POSITION_TAG, QUOTE_TAG, SIDE_BET_TAG,
+                          decode_asset, read_sessions)
+
+np = LazyModule('numpy')
+
+PricingEngine = Callable[[AssetBase], float]
+
+# (asset kind, label index, param, indices of the cards drawn when it was traded)
+PositionKey = Tuple[int, int, float, Tuple[int, ...]]
+
+
+def analytic_engine(asset: AssetBase) -> float:
+    return asset.get_expected_value_analytic()
+
+
+# Monte Carlo engine that draws all sample_size completions of the board in one
+# numpy call instead of going through AssetBase.sample() one draw at a time.
+def make_sample_engine(sample_size: int, seed: Optional[int] = None) -> PricingEngine:
+    rng = np.random.default_rng(seed)
+
+    def sample_engine(asset: AssetBase) -> float:
+        exist_cards = asset.get_exist_cards()
+        remain_rounds = asset.state.get_remain_rounds()
+        draws = rng.random((sample_size, len(exist_cards))).argsort(axis=1)[:, :remain_rounds]
+        value_sum = 0.0
+        for draw in draws.tolist():
+            value_sum += asset.get_cards_value(asset.state.cards + [exist_cards[index] for index in draw])
+        return value_sum / sample_size
+    return sample_engine
+
+
+def build_state(card_indices: Tuple[int, ...]) -> State:
+    state = State()
+    for card_index in card_indices:
+        state.step_with(state.deck.cards[card_index])
+    return state
+
+
+def build_asset(key: PositionKey) -> AssetBase:
+    kind, label_index, param, card_indices = key
+    return decode_asset(build_state(card_indices), kind, label_index, param, priced=False)
+
+
+class CachedPricer:
+
+    # A price only depends on the asset and which cards are gone, so positions
+    # sharing those across every replayed session are priced once. The cache is
+    # bounded by the number of reachable deck states, not by the number of games.
+    def __init__(self, engine: PricingEngine):
+        self.engine = engine
+        self.prices = {}
+
+    def price(self, key: PositionKey) -> float:
+        kind, label_index, param, card_indices = key
+        price_key = (kind, label_index, param, frozenset(card_indices))
+        price = self.prices.get(price_key)
+        if price is None:
+            price = self.prices[price_key] = self.engine(build_asset(key))
+        return price
+
+
+class ReplayedSession:
+
+    def __init__(self, records: list[Tuple[bytes, tuple]]):
+        self.state = State()
+        self.card_indices = []
+        self.quotes = []
+        self.side_bets = []
+        self.actions = []
+        self.positions = []
+
+        for tag, values in records:
+            if tag == CARD_TAG:
+                (card_index,) = values
+                self.card_indices.append(card_index)
+                self.state.step_with(self.state.deck.cards[card_index])
+            elif tag == QUOTE_TAG:
+                self.quotes.append(list(values))
+            elif tag == SIDE_BET_TAG:
+                self.side_bets.append(list(values))
+            elif tag == ACTION_TAG:
+                self.actions.append(ACTIONS[values[0]])
+            elif tag == POSITION_TAG:
+                kind, label_index, param, amount, price = values
+                key = (kind, label_index, param, tuple(self.card_indices))
+                self.positions.append((key, amount, price))
+
+    def is_finished(self) -> bool:
+        return self.state.get_remain_rounds() == 0
+
+    def get_expected_pnl(self, pricer: Optional[CachedPricer] = None) -> float:
+        if pricer is None:
+            pricer = CachedPricer(analytic_engine)
+        pnl = 0.0
+        for (key, amount, price) in self.positions:
+            pnl += (pricer.price(key) - price) * amount
+        return pnl
+
+    def get_realized_pnl(self) -> float:
+        assert (self.is_finished()), "realized pnl needs all rounds revealed"
+        pnl = 0.0
+        for (key, amount, price) in self.positions:
+            pnl += (build_asset(key).get_cards_value(self.state.cards) - price) * amount
+        return pnl
+
+
+def replay_sessions(paths: Iterable[str]) -> Iterator[ReplayedSession]:
+    for path in paths:
+        for records in read_sessions(path):
+            yield ReplayedSession(records)
+
+
+def reprice(paths: Iterable[str], engine: PricingEngine,
+            baseline_engine: PricingEngine = analytic_engine) -> Iterator[Tuple[float, float]]:
+    pricer = CachedPricer(engine)
+    baseline_pricer = CachedPricer(baseline_engine)
+    for session in replay_sessions(paths):
+        yield session.get_expected_pnl(baseline_pricer), session.get_expected_pnl(pricer)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Re-price recorded sessions with a sampling engine.")
+    parser.add_argument('logs', nargs='+')
+    parser.add_argument('--sample-size', type=int, default=1000)
+    args = parser.parse_args()
+
+    sessions = 0
+    baseline_pnl = 0.0
+    repriced_pnl = 0.0
+    for baseline, repriced in reprice(args.logs, make_sample_engine(args.sample_size)):
+        sessions += 1
+        baseline_pnl += baseline
+        repriced_pnl += repriced
+    print(f"Replayed {sessions} sessions")
+    print(f"Expected pnl (analytic): {baseline_pnl}")
+    print(f"Expected pnl (sampled): {repriced_pnl}")
+    print(f"Pricing impact: {repriced_pnl - baseline_pnl}")
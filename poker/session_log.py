@@ -0,0 +1,168 @@
+import mmap
+import os
+import struct
+import zlib
+from typing import Iterator, Optional, Tuple
+
+from .deck import Card, suits
+from .state import State
+from .assets import (AssetBase, SumOfValuesAsset, SumOfSuitValuesAsset, XDivideBySuitCountAsset,
+                     XToTheSuitCountAsset, SuitCountFactorialAsset, MaxSuitValueAsset,
+                     MinSuitValueAsset, SuitSideBetAsset, ValueSideBetAsset)
+
+
+# A log is a sequence of session frames: magic, payload length and crc32 of the
+# payload, then the payload itself. The payload is a run of records, each a one
+# byte tag followed by a fixed-size little-endian body. A frame that was cut short
+# or fails its checksum is skipped by scanning forward to the next magic, so a
+# crashed writer only loses its own session.
+SESSION_MAGIC = b'PKRS'
+SESSION_HEADER = struct.Struct('<4sII')
+
+CARD_TAG = b'C'
+QUOTE_TAG = b'Q'
+SIDE_BET_TAG = b'B'
+ACTION_TAG = b'A'
+POSITION_TAG = b'P'
+
+CARD_FORMAT = struct.Struct('<B')
+QUOTE_FORMAT = struct.Struct('<dd')
+SIDE_BET_FORMAT = struct.Struct('<dd')
+ACTION_FORMAT = struct.Struct('<B')
+POSITION_FORMAT = struct.Struct('<BBddd')
+
+RECORD_FORMATS = {
+    CARD_TAG: CARD_FORMAT,
+    QUOTE_TAG: QUOTE_FORMAT,
+    SIDE_BET_TAG: SIDE_BET_FORMAT,
+    ACTION_TAG: ACTION_FORMAT,
+    POSITION_TAG: POSITION_FORMAT,
+}
+
+ACTIONS = ['buy', 'sell']
+
+# Append only: new asset kinds and labels go at the end so old logs stay readable.
+ASSET_KINDS = [
+    SumOfValuesAsset,
+    SumOfSuitValuesAsset,
+    XDivideBySuitCountAsset,
+    XToTheSuitCountAsset,
+    SuitCountFactorialAsset,
+    MaxSuitValueAsset,
+    MinSuitValueAsset,
+    SuitSideBetAsset,
+    ValueSideBetAsset,
+]
+LABELS = suits + ['red', 'black', 'small', 'large']
+NO_LABEL = 255
+
+
+def encode_asset(asset: AssetBase) -> Tuple[int, int, float]:
+    kind = ASSET_KINDS.index(type(asset))
+    label = getattr(asset, 'suit', getattr(asset, 'side', None))
+    label_index = NO_LABEL if label is None else LABELS.index(label)
+    param = getattr(asset, 'numerator', getattr(asset, 'base', 0.0))
+    return kind, label_index, float(param)
+
+
+def decode_asset(state: State, kind: int, label_index: int, param: float, priced: bool = True) -> AssetBase:
+    asset_cls = ASSET_KINDS[kind]
+    if label_index == NO_LABEL:
+        return asset_cls(state, priced=priced)
+    label = LABELS[label_index]
+    if asset_cls is XDivideBySuitCountAsset or asset_cls is XToTheSuitCountAsset:
+        if param.is_integer():
+            param = int(param)
+        return asset_cls(state, param, label, priced=priced)
+    return asset_cls(state, label, priced=priced)
+
+
+# Records are buffered and each session is written as one frame with a single
+# O_APPEND write when the writer is closed. Use one writer per log file: the
+# frame format tolerates torn writes, but concurrent appends are not coordinated.
+class SessionLogWriter:
+
+    def __init__(self, path: str):
+        self.path = path
+        self.buffer = bytearray()
+        self.closed = False
+
+    def __enter__(self) -> 'SessionLogWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write_record(self, tag: bytes, *values):
+        self.buffer += tag + RECORD_FORMATS[tag].pack(*values)
+
+    def log_card(self, state: State, card: Card):
+        self.write_record(CARD_TAG, state.deck.card2index[card.to_string()])
+
+    def log_quote(self, quote: list[float]):
+        self.write_record(QUOTE_TAG, *quote)
+
+    def log_side_bets(self, amounts: list[float]):
+        self.write_record(SIDE_BET_TAG, *amounts)
+
+    def log_action(self, action: str):
+        self.write_record(ACTION_TAG, ACTIONS.index(action))
+
+    def log_position(self, asset: AssetBase, amount: float, price: float):
+        self.write_record(POSITION_TAG, *encode_asset(asset), amount, price)
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        payload = bytes(self.buffer)
+        frame = SESSION_HEADER.pack(SESSION_MAGIC, len(payload), zlib.crc32(payload)) + payload
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            # A torn frame would be silently skipped by the reader, so fail loudly instead.
+            written = os.write(fd, frame)
+            if written != len(frame):
+                raise OSError(f"Short write to {self.path}: {written} of {len(frame)} bytes of the session frame")
+        finally:
+            os.close(fd)
+
+
+def read_records(payload: bytes) -> list[Tuple[bytes, tuple]]:
+    records = []
+    offset = 0
+    while offset < len(payload):
+        tag = payload[offset:offset + 1]
+        record_format = RECORD_FORMATS.get(tag)
+        if record_format is None:
+            raise ValueError(f"Unknown record tag {tag!r} at payload offset {offset}")
+        records.append((tag, record_format.unpack_from(payload, offset + 1)))
+        offset += 1 + record_format.size
+    return records
+
+
+def find_session(data: mmap.mmap, offset: int) -> Optional[Tuple[int, bytes]]:
+    while True:
+        start = data.find(SESSION_MAGIC, offset)
+        if start < 0 or start + SESSION_HEADER.size > len(data):
+            return None
+        _, length, checksum = SESSION_HEADER.unpack_from(data, start)
+        payload_start = start + SESSION_HEADER.size
+        payload = data[payload_start:payload_start + length]
+        if len(payload) == length and zlib.crc32(payload) == checksum:
+            return payload_start + length, payload
+        # Truncated or corrupted frame: resync on the next magic after it.
+        offset = start + 1
+
+
+def read_sessions(path: str) -> Iterator[list[Tuple[bytes, tuple]]]:
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            offset = 0
+            while True:
+                session = find_session(data, offset)
+                if session is None:
+                    return
+                offset, payload = session
+                yield read_records(payload)
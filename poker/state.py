@@ -1,4 +1,4 @@
-from deck import Deck, Card
+from .deck import Deck, Card
 
 
 class State:
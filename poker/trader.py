@@ -1,4 +1,4 @@
-from assets import *
+from .assets import AssetBase
 
 
 class Trader:
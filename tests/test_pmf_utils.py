@@ -0,0 +1,53 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from poker.pmf_utils import get_binomial_pmf, get_hypergeom_pmf, hypergeom_table
+
+
+def test_hypergeom_table_matches_scipy():
+    np = pytest.importorskip('numpy')
+    stats = pytest.importorskip('scipy.stats')
+    for (total, target, draws), probs in hypergeom_table.items():
+        xs = np.arange(0, min(draws, target) + 1)
+        expected = stats.hypergeom(total, target, draws).pmf(xs)
+        assert np.allclose(probs, expected, rtol=0, atol=1e-15), (total, target, draws)
+
+
+def test_hypergeom_pmf_sums_to_one():
+    assert sum(get_hypergeom_pmf(37, 9, 1)) == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize('n, p', [(220, 0.1), (55, 3 / 38), (0, 0.5), (10, 1.0)])
+def test_binomial_pmf_matches_scipy(n, p):
+    np = pytest.importorskip('numpy')
+    stats = pytest.importorskip('scipy.stats')
+    xs, probs = get_binomial_pmf(n, p, 3.0)
+    assert xs == [x + 3.0 for x in range(n + 1)]
+    assert np.allclose(probs, stats.binom(n, p).pmf(np.arange(0, n + 1)), rtol=1e-12, atol=1e-15)
+
+
+def run_isolated(code: str) -> str:
+    return subprocess.check_output([sys.executable, '-W', 'ignore', '-c', code], text=True,
+                                   cwd=Path(__file__).resolve().parents[1]).strip()
+
+
+def test_import_game_does_not_load_numerical_backends():
+    loaded = run_isolated("import sys, poker.game; print('numpy' in sys.modules, 'scipy' in sys.modules)")
+    assert loaded == "False False"
+
+
+def test_opening_round_assets_do_not_load_numerical_backends():
+    loaded = run_isolated(
+        "import sys\n"
+        "from poker.state import State\n"
+        "from poker.assets import SumOfValuesAsset, SumOfSuitValuesAsset, SuitSideBetAsset, ValueSideBetAsset\n"
+        "state = State()\n"
+        "for asset in [SumOfValuesAsset(state), SumOfSuitValuesAsset(state, 'heart'),\n"
+        "              SuitSideBetAsset(state, 'red'), ValueSideBetAsset(state, 'small')]:\n"
+        "    asset.get_expected_value_analytic()\n"
+        "print('numpy' in sys.modules, 'scipy' in sys.modules)"
+    )
+    assert loaded == "False False"
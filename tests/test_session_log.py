@@ -0,0 +1,147 @@
+import builtins
+import contextlib
+import io
+import os
+
+import pytest
+
+from poker.state import State
+from poker.assets import (SumOfValuesAsset, SumOfSuitValuesAsset, XDivideBySuitCountAsset,
+                          XToTheSuitCountAsset, SuitCountFactorialAsset, MaxSuitValueAsset,
+                          MinSuitValueAsset, SuitSideBetAsset, ValueSideBetAsset)
+from poker.game import Game
+from poker.session_log import (ASSET_KINDS, POSITION_TAG, SessionLogWriter, decode_asset, read_sessions)
+from poker.replay import CachedPricer, analytic_engine, replay_sessions, reprice
+
+
+def make_assets(state: State) -> list:
+    return [
+        SumOfValuesAsset(state, priced=False),
+        SumOfSuitValuesAsset(state, 'heart', priced=False),
+        XDivideBySuitCountAsset(state, 24, 'square', priced=False),
+        XToTheSuitCountAsset(state, 1.5, 'spade', priced=False),
+        SuitCountFactorialAsset(state, 'club', priced=False),
+        MaxSuitValueAsset(state, 'heart', priced=False),
+        MinSuitValueAsset(state, 'square', priced=False),
+        SuitSideBetAsset(state, 'black', priced=False),
+        ValueSideBetAsset(state, 'small', priced=False),
+    ]
+
+
+def write_known_session(path: str):
+    state = State()
+    with SessionLogWriter(path) as log:
+        log.log_quote([19.0, 20.0])
+        log.log_action('buy')
+        log.log_position(SumOfValuesAsset(state, priced=False), 1, 20.0)
+        log.log_side_bets([2.0, 0.0])
+        log.log_position(SuitSideBetAsset(state, 'red', priced=False), 2, 0.0)
+        for value in ['1', '2', '3', '4']:
+            card = state.deck.cards[state.deck.card2index[f"heart.{value}"]]
+            state.step_with(card)
+            log.log_card(state, card)
+
+
+def test_round_trip_covers_every_asset_kind(tmp_path):
+    path = str(tmp_path / 'session.log')
+    state = State()
+    assets = make_assets(state)
+    assert [type(asset) for asset in assets] == ASSET_KINDS
+
+    with SessionLogWriter(path) as log:
+        for amount, asset in enumerate(assets):
+            log.log_position(asset, amount, 0.5)
+
+    [records] = list(read_sessions(path))
+    assert len(records) == len(assets)
+    for amount, (asset, (tag, values)) in enumerate(zip(assets, records)):
+        kind, label_index, param, logged_amount, price = values
+        decoded = decode_asset(state, kind, label_index, param, priced=False)
+        assert tag == POSITION_TAG
+        assert type(decoded) is type(asset)
+        assert decoded.to_string() == asset.to_string()
+        assert (logged_amount, price) == (amount, 0.5)
+
+    decoded = decode_asset(state, *records[2][1][:3], priced=False)
+    assert decoded.numerator == 24 and isinstance(decoded.numerator, int)
+    assert decode_asset(state, *records[3][1][:3], priced=False).base == 1.5
+
+
+def test_truncated_session_is_skipped(tmp_path):
+    path = str(tmp_path / 'session.log')
+    write_known_session(path)
+    write_known_session(path)
+    with open(path, 'rb') as file:
+        data = file.read()
+    frame_size = len(data) // 2
+    # A crashed writer leaves half a frame, then a later writer appends a full one.
+    with open(path, 'wb') as file:
+        file.write(data[:frame_size] + data[:frame_size - 7] + data[:frame_size] + data[:5])
+
+    sessions = list(read_sessions(path))
+    assert len(sessions) == 2
+    assert sessions[0] == sessions[1]
+
+
+def test_short_write_raises(tmp_path, monkeypatch):
+    path = str(tmp_path / 'session.log')
+    write = os.write
+    monkeypatch.setattr(os, 'write', lambda fd, data: write(fd, data[:5]))
+
+    with pytest.raises(OSError, match="Short write"):
+        write_known_session(path)
+
+
+def test_replayed_pnl_on_known_cards(tmp_path):
+    path = str(tmp_path / 'session.log')
+    write_known_session(path)
+
+    [session] = list(replay_sessions([path]))
+    assert [card.to_string() for card in session.state.cards] == ['heart.1', 'heart.2', 'heart.3', 'heart.4']
+    assert session.quotes == [[19.0, 20.0]]
+    assert session.side_bets == [[2.0, 0.0]]
+    assert session.actions == ['buy']
+    # The sum of all 40 values is 220 and 4 of 40 cards are drawn; red is a coin flip.
+    assert session.get_expected_pnl() == pytest.approx((22.0 - 20.0) * 1 + 0.0 * 2)
+    # Values sum to 10 and the first card is red.
+    assert session.get_realized_pnl() == pytest.approx((10.0 - 20.0) * 1 + 1.0 * 2)
+
+
+def test_reprice_prices_each_distinct_position_once(tmp_path):
+    path = str(tmp_path / 'session.log')
+    for _ in range(3):
+        write_known_session(path)
+
+    calls = []
+
+    def counting_engine(asset):
+        calls.append(asset.to_string())
+        return analytic_engine(asset)
+
+    results = list(reprice([path], counting_engine))
+    assert len(results) == 3
+    assert all(baseline == pytest.approx(repriced) for baseline, repriced in results)
+    assert sorted(calls) == ['suit side bet: red', 'sum of card values']
+
+
+def test_cached_pricer_ignores_draw_order():
+    pricer = CachedPricer(analytic_engine)
+    price = pricer.price((0, 255, 0.0, (3, 17)))
+    assert pricer.price((0, 255, 0.0, (17, 3))) == price
+    assert len(pricer.prices) == 1
+
+
+def test_game_logs_quotes_and_side_bets_separately(tmp_path, monkeypatch):
+    path = str(tmp_path / 'session.log')
+    inputs = iter(["10 40", "5 8", "1 -2"])
+    monkeypatch.setattr(builtins, 'input', lambda: next(inputs))
+
+    game = Game(path)
+    with contextlib.redirect_stdout(io.StringIO()), pytest.raises(NotImplementedError):
+        game.play()
+
+    [session] = list(replay_sessions([path]))
+    assert session.quotes == [[10.0, 40.0], [5.0, 8.0]]
+    assert session.side_bets == [[1.0, -2.0]]
+    assert len(session.actions) == 2
+    assert len(session.positions) == 4